@@ -0,0 +1,38 @@
+import os
+import queue
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web"))
+
+from events import DROP_BACKLOG, DROP_OLDEST, EventBus  # noqa: E402
+
+
+class OverflowPolicyTest(unittest.TestCase):
+    def test_lagged_subscriber_receives_newest_message(self):
+        bus = EventBus(capacity=4)
+        subscription = bus.listen(DROP_BACKLOG)
+        for value in range(10):
+            bus.publish("battery_status", {"value": value})
+
+        message = subscription.get(block=False)
+
+        self.assertEqual(message.payload, {"value": 9})
+        self.assertEqual(subscription.missed, 9)
+        with self.assertRaises(queue.Empty):
+            subscription.get(block=False)
+
+    def test_drop_oldest_resumes_at_oldest_retained(self):
+        bus = EventBus(capacity=4)
+        subscription = bus.listen(DROP_OLDEST)
+        for value in range(10):
+            bus.publish("battery_status", {"value": value})
+
+        received = [subscription.get(block=False).payload["value"] for _ in range(4)]
+
+        self.assertEqual(received, [6, 7, 8, 9])
+        self.assertEqual(subscription.missed, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
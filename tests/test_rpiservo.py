@@ -0,0 +1,65 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "web"))
+
+import pca9685_driver  # noqa: E402
+import RPIservo  # noqa: E402
+
+
+class _RecordingBus:
+    def __init__(self, *args):
+        self.blocks = []
+
+    def write_i2c_block_data(self, addr, reg, data):
+        self.blocks.append((reg, list(data)))
+
+    def write_byte_data(self, addr, reg, value):
+        pass
+
+    def close(self):
+        pass
+
+
+class SetAnglesFallbackTest(unittest.TestCase):
+    def setUp(self):
+        self._saved = (pca9685_driver.SMBus, pca9685_driver.time.sleep, RPIservo._HAVE_ADAFRUIT)
+        pca9685_driver.SMBus = _RecordingBus
+        pca9685_driver.time.sleep = lambda _: None
+        RPIservo._HAVE_ADAFRUIT = False
+        self.ctrl = RPIservo.ServoCtrl()
+        self.ctrl._ensure_driver()
+        self.bus = self.ctrl.pwm_servo._bus
+        self.bus.blocks.clear()
+
+    def tearDown(self):
+        pca9685_driver.SMBus, pca9685_driver.time.sleep, RPIservo._HAVE_ADAFRUIT = self._saved
+
+    def test_runs_around_led_channel_use_one_block_write_each(self):
+        self.ctrl.set_angles([90] * RPIservo.servo_num)
+
+        led = RPIservo._PWM_LED_CHANNEL
+        ticks = pca9685_driver.us_to_ticks(pca9685_driver.angle_to_us(90))
+        channel = [0, 0, ticks & 0xFF, ticks >> 8]
+        base = pca9685_driver._SMBusPCA9685.LED0_ON_L
+        self.assertEqual(
+            self.bus.blocks,
+            [
+                (base, channel * led),
+                (base + 4 * (led + 1), channel * (RPIservo.servo_num - led - 1)),
+            ],
+        )
+
+    def test_none_entries_are_skipped(self):
+        angles = [None] * RPIservo.servo_num
+        angles[1] = 0
+        self.ctrl.set_angles(angles)
+
+        ticks = pca9685_driver.us_to_ticks(pca9685_driver.angle_to_us(0))
+        base = pca9685_driver._SMBusPCA9685.LED0_ON_L
+        self.assertEqual(self.bus.blocks, [(base + 4, [0, 0, ticks & 0xFF, ticks >> 8])])
+
+
+if __name__ == "__main__":
+    unittest.main()
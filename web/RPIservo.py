@@ -165,20 +165,51 @@ class ServoCtrl(threading.Thread):
     def _release_channel(self, channel):
         self.relax(channel)
 
+    def _clamp_angle(self, angle):
+        return max(self.ctrlRangeMin, min(self.ctrlRangeMax, angle))
+
+    def _angle_ticks(self, angle):
+        """Clamp ``angle`` to the control range and convert it to PCA9685 ticks."""
+        pulse_us = angle_to_us(self._clamp_angle(angle), self._servo_min_pulse_us, self._servo_max_pulse_us)
+        return us_to_ticks(pulse_us, self._frequency)
+
     def set_angle(self, ID, angle):
         self._ensure_driver()
         if ID == _PWM_LED_CHANNEL:
             return
-        angle = max(self.ctrlRangeMin, min(self.ctrlRangeMax, angle))
         if not self._use_fallback:
             channel_obj = self._servo_channels[ID]
             if channel_obj is None:
                 return
-            channel_obj.angle = angle
+            channel_obj.angle = self._clamp_angle(angle)
+            return
+        self.pwm_servo.set_pwm(ID, 0, self._angle_ticks(angle))
+
+    def set_angles(self, angles):
+        """Set every servo from a per-channel list of angles (None skips one).
+
+        On the smbus fallback each run of consecutive channels is sent in a
+        single PCA9685 block write instead of one transfer per servo.
+        """
+        self._ensure_driver()
+        if not self._use_fallback:
+            for ID, angle in enumerate(angles):
+                if angle is not None:
+                    self.set_angle(ID, angle)
             return
-        pulse_us = angle_to_us(angle, self._servo_min_pulse_us, self._servo_max_pulse_us)
-        ticks = us_to_ticks(pulse_us, self._frequency)
-        self.pwm_servo.set_pwm(ID, 0, ticks)
+        first = 0
+        run = []
+        for ID, angle in enumerate(angles):
+            if angle is None or ID == _PWM_LED_CHANNEL:
+                if run:
+                    self.pwm_servo.set_pwm_bulk(first, run)
+                    run = []
+                continue
+            if not run:
+                first = ID
+            run.append((0, self._angle_ticks(angle)))
+        if run:
+            self.pwm_servo.set_pwm_bulk(first, run)
 
     def pause(self):
         print('......................pause..........................')
@@ -198,10 +229,19 @@ class ServoCtrl(threading.Thread):
         else:
             channels = [ch]
         if self._use_fallback:
+            # Zero each run of consecutive relaxable channels in one block write.
+            first = count = 0
             for idx in channels:
                 if idx == _PWM_LED_CHANNEL or idx in self._no_relax_channels:
                     continue
-                self.pwm_servo.set_pwm(idx, 0, 0)
+                if count and idx == first + count:
+                    count += 1
+                    continue
+                if count:
+                    self.pwm_servo.off_channels(first, count)
+                first, count = idx, 1
+            if count:
+                self.pwm_servo.off_channels(first, count)
         else:
             for idx in channels:
                 if idx == _PWM_LED_CHANNEL or idx in self._no_relax_channels:
@@ -242,8 +282,8 @@ class ServoCtrl(threading.Thread):
 
     def moveInit(self):
         self.scMode = 'init'
+        self.set_angles(self.initPos)
         for i in range(0, servo_num):
-            self.set_angle(i, self.initPos[i])
             self.lastPos[i] = self.initPos[i]
             self.nowPos[i] = self.initPos[i]
             self.bufferPos[i] = float(self.initPos[i])
@@ -12,7 +12,7 @@ import threading
 
 import battery_monitor
 import servo_calibration
-from events import event_bus
+from events import event_bus, format_sse
 
 # Raspberry Pi camera module (requires picamera package)
 # from camera_pi import Camera
@@ -136,23 +136,14 @@ def shoulder_servo_calibration():
 def sse_events():
     """Server-sent events stream for UI updates."""
     def stream():
-        queue = event_bus.listen()
-        queue.put({
-            "type": "shoulder_calibration",
-            "payload": servo_calibration.get_shoulder_calibration(),
-        })
-        queue.put({
-            "type": "battery_status",
-            "payload": battery_monitor.sample_status(),
-        })
+        subscription = event_bus.listen()
         try:
+            yield format_sse("shoulder_calibration", servo_calibration.get_shoulder_calibration())
+            yield format_sse("battery_status", battery_monitor.sample_status())
             while True:
-                message = queue.get()
-                event_type = message.get("type", "message")
-                payload = message.get("payload", {})
-                yield f"event: {event_type}\ndata: {json.dumps(payload)}\n\n"
+                yield subscription.get().sse
         except GeneratorExit:
-            event_bus.remove(queue)
+            event_bus.remove(subscription)
 
     return Response(stream(), mimetype='text/event-stream')
 
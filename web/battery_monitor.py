@@ -1,63 +1,117 @@
 #!/usr/bin/env python3
 """Read battery voltage from ADS7830 (Robot HAT V3.1) and map to percentage."""
+import functools
 import json
 import os
 import threading
 import time
 import weakref
 from pathlib import Path
+from types import MappingProxyType
 import logging
 
-from math import isclose
+from math import floor, isclose
 
-try:
-    import board  # type: ignore
-    import busio  # type: ignore
-except Exception:
-    board = None
-    busio = None
+# Hardware drivers are imported on first BatteryMonitor construction; Blinka
+# probes the board and /sys on import, which is slow and pointless for
+# processes that only read the calibration helpers.
+board = None
+busio = None
+_ads7830 = None
+AnalogIn = None
+SMBus = None
+i2c_msg = None
+_DRIVERS_IMPORTED = False
 
-try:
-    import adafruit_ads7830.ads7830 as _ads7830  # type: ignore
-    from adafruit_ads7830.analog_in import AnalogIn  # type: ignore
-except Exception:
-    _ads7830 = None  # type: ignore
-    AnalogIn = None  # type: ignore
 
-try:
-    from smbus2 import SMBus  # type: ignore
-except ImportError:
+def _lazy_imports() -> None:
+    global board, busio, _ads7830, AnalogIn, SMBus, i2c_msg, _DRIVERS_IMPORTED
+    if _DRIVERS_IMPORTED:
+        return
     try:
-        from smbus import SMBus  # type: ignore
+        import board  # type: ignore
+        import busio  # type: ignore
+    except Exception:
+        board = None
+        busio = None
+
+    try:
+        import adafruit_ads7830.ads7830 as _ads7830  # type: ignore
+        from adafruit_ads7830.analog_in import AnalogIn  # type: ignore
+    except Exception:
+        _ads7830 = None  # type: ignore
+        AnalogIn = None  # type: ignore
+
+    try:
+        from smbus2 import SMBus, i2c_msg  # type: ignore
     except ImportError:
-        SMBus = None  # type: ignore
+        i2c_msg = None  # type: ignore
+        try:
+            from smbus import SMBus  # type: ignore
+        except ImportError:
+            SMBus = None  # type: ignore
+    _DRIVERS_IMPORTED = True
 
-ADS7830_ADDRESS = 0x48
 
-_MIN_VOLT = float(os.getenv("BATTERY_VOLT_MIN", "6.8"))
-_MAX_VOLT = float(os.getenv("BATTERY_VOLT_MAX", "8.4"))
-_CHANNEL = int(os.getenv("BATTERY_ADC_CHANNEL", "0"))
-
-_CAL_FILE = Path(
-    os.getenv(
-        "BATTERY_CAL_FILE",
-        os.path.join(os.path.dirname(__file__), "battery_calibration.json"),
-    )
-)
-_VOLT_SCALE = float(os.getenv("BATTERY_VOLT_SCALE", str(_MAX_VOLT)))
-_CAL_FACTOR = float(os.getenv("BATTERY_CAL_FACTOR", "1.0"))
-_CAL_OFFSET = float(os.getenv("BATTERY_CAL_OFFSET", "0.0"))
-
-_DEFAULT_CAL = {
-    "scale": _VOLT_SCALE,
-    "factor": _CAL_FACTOR,
-    "offset": _CAL_OFFSET,
-    "min_voltage": _MIN_VOLT,
-    "max_voltage": _MAX_VOLT,
-}
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+ADS7830_ADDRESS = 0x48
+# The i2c-dev driver caps I2C_RDWR at 42 messages, i.e. 21 write/read pairs.
+_I2C_RDWR_MAX_PAIRS = 21
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return default if value is None else float(value)
+
+
+def _read_env() -> MappingProxyType:
+    """Snapshot every BATTERY_* setting in one pass at import."""
+    max_voltage = _env_float("BATTERY_VOLT_MAX", 8.4)
+    return MappingProxyType({
+        "min_voltage": _env_float("BATTERY_VOLT_MIN", 6.8),
+        "max_voltage": max_voltage,
+        "scale": _env_float("BATTERY_VOLT_SCALE", max_voltage),
+        "factor": _env_float("BATTERY_CAL_FACTOR", 1.0),
+        "offset": _env_float("BATTERY_CAL_OFFSET", 0.0),
+        "channel": int(os.getenv("BATTERY_ADC_CHANNEL", "0")),
+        # Upper bound on the poll-interval multiplier while the reading is
+        # stable. Off by default: the low-voltage cutoff reads the cached value.
+        "poll_max_backoff": max(1, int(os.getenv("BATTERY_POLL_MAX_BACKOFF", "1"))),
+        "cal_file": os.getenv(
+            "BATTERY_CAL_FILE",
+            os.path.join(os.path.dirname(__file__), "battery_calibration.json"),
+        ),
+    })
+
+
+_ENV = _read_env()
+_CAL_KEYS = ("scale", "factor", "offset", "min_voltage", "max_voltage")
+
+_MIN_VOLT = _ENV["min_voltage"]
+_MAX_VOLT = _ENV["max_voltage"]
+_CHANNEL = _ENV["channel"]
+_POLL_MAX_BACKOFF = _ENV["poll_max_backoff"]
+_CAL_FILE = Path(_ENV["cal_file"])
+_VOLT_SCALE = _ENV["scale"]
+_CAL_FACTOR = _ENV["factor"]
+_CAL_OFFSET = _ENV["offset"]
+
+_DEFAULT_CAL = {key: _ENV[key] for key in _CAL_KEYS}
 _CAL_LOCK = threading.Lock()
-# Track live monitor instances so calibration changes propagate immediately.
-_ACTIVE_MONITORS = weakref.WeakSet()
+# Bytes last read from / written to _CAL_FILE; identical saves are skipped.
+_CAL_PERSISTED = None
+# (mtime_ns, size) of _CAL_FILE as last loaded or saved; unchanged files are
+# not re-read by _load_calibration.
+_CAL_STAT = None
+# Track the live monitor so calibration changes propagate immediately. Only
+# one monitor runs per process, so a single weak reference is enough.
+_ACTIVE_MONITOR_REF = None
+_BUS_LOCK = threading.Lock()
+_SHARED_BUS = {"bus": None, "refs": 0, "kind": None}
 try:
     from events import event_bus
 except Exception:
@@ -66,21 +120,58 @@ except Exception:
 logger = logging.getLogger("rasptank")
 
 
+def _encode_calibration(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _decode_calibration(blob: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+def _stat_key(path: Path):
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
 def _save_calibration(data: dict) -> None:
+    global _CAL_PERSISTED, _CAL_STAT
+    blob = _encode_calibration(data)
     try:
         with _CAL_LOCK:
-            _CAL_FILE.write_text(json.dumps(data, indent=2))
+            if blob == _CAL_PERSISTED:
+                return
+            # Write a sibling temp file and rename it over the target so a
+            # power loss never leaves a truncated calibration file behind.
+            tmp = _CAL_FILE.with_name(_CAL_FILE.name + ".tmp")
+            with open(tmp, "wb") as handle:
+                handle.write(blob)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(tmp, _CAL_FILE)
+            _CAL_PERSISTED = blob
+            _CAL_STAT = _stat_key(_CAL_FILE)
     except Exception as exc:
         logger.error({"evt": "battery_calibration_save_error", "error": str(exc)})
 
 
 def _load_calibration() -> None:
-    global _VOLT_SCALE, _CAL_FACTOR, _CAL_OFFSET, _MIN_VOLT, _MAX_VOLT
+    global _VOLT_SCALE, _CAL_FACTOR, _CAL_OFFSET, _MIN_VOLT, _MAX_VOLT, _CAL_PERSISTED, _CAL_STAT
     if not _CAL_FILE.is_file():
         _save_calibration(_DEFAULT_CAL)
         return
     try:
-        data = json.loads(_CAL_FILE.read_text())
+        key = _stat_key(_CAL_FILE)
+        if key == _CAL_STAT:
+            # Globals already reflect this exact file; skip the read and parse.
+            return
+        blob = _CAL_FILE.read_bytes()
+        data = _decode_calibration(blob)
+        _CAL_PERSISTED = blob
+        _CAL_STAT = key
         if "scale" in data:
             _VOLT_SCALE = float(data["scale"])
         if "factor" in data:
@@ -116,7 +207,8 @@ def _apply_calibration_to_all(scale: float, factor: float, offset: float) -> dic
     _CAL_OFFSET = float(offset)
     data = get_calibration()
     _save_calibration(data)
-    for monitor in list(_ACTIVE_MONITORS):
+    monitor = _get_active_monitor()
+    if monitor is not None:
         try:
             monitor.update_calibration(_VOLT_SCALE, _CAL_FACTOR, _CAL_OFFSET)
         except Exception as exc:
@@ -124,21 +216,83 @@ def _apply_calibration_to_all(scale: float, factor: float, offset: float) -> dic
     return data
 
 
+def _clear_active_ref(ref) -> None:
+    global _ACTIVE_MONITOR_REF
+    if _ACTIVE_MONITOR_REF is ref:
+        _ACTIVE_MONITOR_REF = None
+
+
+def _set_active_monitor(monitor) -> None:
+    global _ACTIVE_MONITOR_REF
+    _ACTIVE_MONITOR_REF = weakref.ref(monitor, _clear_active_ref)
+
+
+def _release_active_monitor(monitor) -> None:
+    ref = _ACTIVE_MONITOR_REF
+    if ref is not None and ref() is monitor:
+        _clear_active_ref(ref)
+
+
+class _I2CProxy:
+    """Minimal SMBus-style wrapper over a busio I2C object."""
+
+    def __init__(self, i2c):
+        self._i2c = i2c
+
+    def read_byte_data(self, addr, cmd):
+        out = bytearray(1)
+        self._i2c.writeto(addr, bytes([cmd]))
+        self._i2c.readfrom_into(addr, out)
+        return out[0]
+
+
+def _acquire_bus():
+    """Return the process-wide ADS7830 bus handle and its kind, opening it once.
+
+    Transient monitors from sample_status()/calibrate_to_voltage() share the
+    poll thread's handle instead of reopening /dev/i2c-1.
+    """
+    with _BUS_LOCK:
+        if _SHARED_BUS["bus"] is None:
+            if SMBus is not None:
+                _SHARED_BUS["bus"] = SMBus(1)
+                _SHARED_BUS["kind"] = "smbus"
+            elif board and busio:
+                _SHARED_BUS["bus"] = _I2CProxy(busio.I2C(board.SCL, board.SDA))
+                _SHARED_BUS["kind"] = "busio"
+            else:
+                raise RuntimeError("No SMBus or busio available for ADS7830")
+        _SHARED_BUS["refs"] += 1
+        return _SHARED_BUS["bus"], _SHARED_BUS["kind"]
+
+
+def _release_bus() -> None:
+    with _BUS_LOCK:
+        _SHARED_BUS["refs"] -= 1
+        if _SHARED_BUS["refs"] > 0:
+            return
+        bus = _SHARED_BUS["bus"]
+        _SHARED_BUS.update(bus=None, refs=0, kind=None)
+    close = getattr(bus, "close", None)
+    if callable(close):
+        close()
+
+
 def _get_active_monitor():
-    for monitor in list(_ACTIVE_MONITORS):
-        return monitor
-    return None
+    ref = _ACTIVE_MONITOR_REF
+    return ref() if ref is not None else None
 
 
-def sample_status(samples: int = 5, delay: float = 0.05) -> dict:
+def sample_status(samples: int = 5, delay: float = 0.0) -> dict:
+    # No inter-sample delay by default, so reads take the single-ioctl burst
+    # path of _sample_raw() instead of blocking the request for ~250 ms.
     monitor = _get_active_monitor()
     created = False
     if monitor is None:
         monitor = BatteryMonitor(interval=0.0)
         created = True
     try:
-        raw = monitor.sample_voltage(calibrated=False, samples=samples, delay=delay)
-        calibrated = monitor.sample_voltage(calibrated=True, samples=samples, delay=delay)
+        raw, calibrated = monitor._raw_to_voltages(monitor._sample_raw(samples, delay))
         return {
             "raw_voltage": raw,
             "voltage": calibrated,
@@ -149,6 +303,8 @@ def sample_status(samples: int = 5, delay: float = 0.05) -> dict:
 
 
 def calibrate_to_voltage(actual_voltage: float, samples: int = 20, delay: float = 0.05) -> dict:
+    # Unlike sample_status(), keep the samples spread over ~1 s so load ripple
+    # averages out instead of skewing the stored calibration factor.
     if actual_voltage <= 0:
         raise ValueError("actual_voltage must be positive")
     monitor = _get_active_monitor()
@@ -171,34 +327,63 @@ def calibrate_to_voltage(actual_voltage: float, samples: int = 20, delay: float
             monitor.close()
 
 
-def _to_percentage(voltage: float) -> int:
-    if isclose(_MAX_VOLT, _MIN_VOLT):
-        return 0
-    pct = (voltage - _MIN_VOLT) / (_MAX_VOLT - _MIN_VOLT) * 100.0
-    return max(0, min(100, int(round(pct))))
+def _centivolts(voltage: float) -> int:
+    """Quantize a voltage to integer hundredths of a volt."""
+    return floor(voltage * 100.0 + 0.5)
+
+
+def _pct_from_cv(pct_cv: tuple, voltage_cv: int) -> int:
+    """Look up the percentage for ``voltage_cv`` in a ``(base_cv, table)`` pair."""
+    base_cv, lut = pct_cv
+    idx = voltage_cv - base_cv
+    if idx <= 0:
+        return lut[0]
+    return lut[idx] if idx < len(lut) else lut[-1]
+
 
 class BatteryMonitor(threading.Thread):
     def __init__(self, interval: float = 5.0):
         super().__init__(daemon=True)
         self._interval = interval
-        self._voltage = 0.0
-        self._percentage = 0
+        # Published reading as (voltage_cv, percentage, raw_voltage_cv), with
+        # voltages in centivolts. Replaced wholesale by the poll thread, so
+        # readers need no lock.
+        self._state = (0, 0, 0)
         self._lock = threading.Lock()
-        self._running = threading.Event()
-        self._running.set()
+        # Not named ``_stop``: that would shadow threading.Thread._stop().
+        self._stop_event = threading.Event()
+        # Set by stop() and update_calibration() to cut a poll sleep short.
+        self._wake_event = threading.Event()
         self._bus = None
         self._use_smbus = False
         self._adc = None
         self._analog_channel = None
+        self._read_raw8 = None
+        self._rdwr = None
+        self._msg_write = None
         self._raw_full_scale = 65535.0
         self._scale_base = _VOLT_SCALE
         self._cal_factor = _CAL_FACTOR
         self._cal_offset = _CAL_OFFSET
-        self._last_raw = 0.0
+        self._volt_per_count = self._scale_base / self._raw_full_scale
+        # Snapshot of the module-level SoC window; refreshed on recalibration.
+        self._min_volt = _MIN_VOLT
+        self._max_volt = _MAX_VOLT
+        self._last_raw_count = None
+        self._last_fp = None
+        # (pct_cv, code_lut) reading tables, rebuilt off to the side and
+        # swapped in with one assignment so the lock-free poll never mixes
+        # tables from two calibrations. See _build_luts().
+        self._luts = (None, None)
+        self._publish = event_bus.publish if event_bus is not None else None
         self._setup()
-        _ACTIVE_MONITORS.add(self)
+        self._luts = self._build_luts()
+        _set_active_monitor(self)
 
     def _setup(self):
+        _lazy_imports()
+        # ADS7830 command byte: 1 0 START A2 A1 A0 PD1 PD0
+        self._cmd = 0x84 | ((_CHANNEL & 0x07) << 4)
         if _ads7830 and AnalogIn and board is not None:
             try:
                 i2c = None
@@ -216,64 +401,147 @@ class BatteryMonitor(threading.Thread):
                 self._adc = None
                 self._analog_channel = None
 
-        if SMBus is not None:
-            self._bus = SMBus(1)
-            self._use_smbus = True
-        elif board and busio:
-            i2c = busio.I2C(board.SCL, board.SDA)
-            # simple wrapper to match SMBus API
-            class _I2CProxy:
-                def __init__(self, i2c):
-                    self._i2c = i2c
-                def read_byte_data(self, addr, cmd):
-                    out = bytearray(1)
-                    self._i2c.writeto(addr, bytes([cmd]))
-                    self._i2c.readfrom_into(addr, out)
-                    return out[0]
-            self._bus = _I2CProxy(i2c)
-        else:
-            raise RuntimeError("No SMBus or busio available for ADS7830")
+        self._bus, kind = _acquire_bus()
+        self._use_smbus = kind == "smbus"
+        self._read_raw8 = self._make_raw8_reader()
+
+    def _make_raw8_reader(self):
+        """Return a zero-argument callable that reads one 8-bit ADC code."""
+        rdwr = getattr(self._bus, "i2c_rdwr", None)
+        if rdwr is not None and i2c_msg is not None:
+            # Prebuilt command write + 1-byte read, issued as one combined
+            # transfer. The buffer is shared between the poll and request
+            # threads, but both sample the same channel, so a racing read
+            # still yields a valid code.
+            write = i2c_msg.write(ADS7830_ADDRESS, [self._cmd])
+            read = i2c_msg.read(ADS7830_ADDRESS, 1)
+            buf = read.buf
+            self._rdwr = rdwr
+            self._msg_write = write
+
+            def _read_raw8():
+                rdwr(write, read)
+                return ord(buf[0])
+
+            return _read_raw8
+        return functools.partial(self._bus.read_byte_data, ADS7830_ADDRESS, self._cmd)
 
     def read_voltage(self) -> float:
-        with self._lock:
-            return self._voltage
+        return self._state[0] / 100.0
 
     def read_percentage(self) -> int:
-        with self._lock:
-            return self._percentage
+        return self._state[1]
 
     def _read_channel(self) -> int:
         if self._analog_channel is not None:
             return self._analog_channel.value
-        # ADS7830 command byte: 1 0 START A2 A1 A0 PD1 PD0
-        cmd = 0x84 | ((_CHANNEL & 0x07) << 4)
-        if self._bus is None:
+        read_raw8 = self._read_raw8
+        if read_raw8 is None:
             raise RuntimeError("ADS7830 bus not initialized")
-        raw8 = self._bus.read_byte_data(ADS7830_ADDRESS, cmd)
-        return raw8 * 257
+        return read_raw8() * 257
+
+    def _read_channel_burst(self, count: int) -> int:
+        """Return the summed raw counts of ``count`` back-to-back conversions.
+
+        Packs up to 21 command/read pairs into each I2C_RDWR ioctl; only
+        valid when ``self._rdwr`` is set.
+        """
+        rdwr = self._rdwr
+        write = self._msg_write
+        total = 0
+        while count > 0:
+            n = min(count, _I2C_RDWR_MAX_PAIRS)
+            reads = [i2c_msg.read(ADS7830_ADDRESS, 1) for _ in range(n)]
+            msgs = []
+            for read in reads:
+                msgs.append(write)
+                msgs.append(read)
+            rdwr(*msgs)
+            total += sum(ord(read.buf[0]) for read in reads)
+            count -= n
+        return total * 257
 
     def _raw_to_voltage(self, raw: int, calibrated: bool = True) -> float:
-        base = (raw / self._raw_full_scale) * self._scale_base
+        base = raw * self._volt_per_count
         if calibrated:
             base = base * self._cal_factor + self._cal_offset
         return base
 
-    def sample_voltage(self, calibrated: bool = True, samples: int = 1, delay: float = 0.0) -> float:
-        total = 0.0
-        count = 0
-        for _ in range(max(1, samples)):
-            raw = self._read_channel()
-            total += self._raw_to_voltage(raw, calibrated=calibrated)
-            count += 1
+    def _raw_to_voltages(self, raw: int) -> tuple:
+        """Return ``(uncalibrated, calibrated)`` voltages from one conversion."""
+        base = raw * self._volt_per_count
+        return base, base * self._cal_factor + self._cal_offset
+
+    def _sample_raw(self, samples: int = 1, delay: float = 0.0) -> float:
+        """Return the mean raw count over ``samples`` ADC conversions."""
+        count = max(1, samples)
+        if not delay and self._rdwr is not None:
+            return self._read_channel_burst(count) / count
+        read = self._read_channel
+        raw_total = 0
+        for _ in range(count):
+            raw_total += read()
             if delay:
                 time.sleep(delay)
-        return total / count
+        return raw_total / count
+
+    def sample_voltage(self, calibrated: bool = True, samples: int = 1, delay: float = 0.0) -> float:
+        # The raw->voltage mapping is linear, so average the integer counts and
+        # convert once instead of doing the float math per sample.
+        return self._raw_to_voltage(self._sample_raw(samples, delay), calibrated=calibrated)
 
     def update_calibration(self, scale: float, factor: float, offset: float) -> None:
         with self._lock:
             self._scale_base = float(scale)
+            self._volt_per_count = self._scale_base / self._raw_full_scale
             self._cal_factor = float(factor)
             self._cal_offset = float(offset)
+            self._min_volt = _MIN_VOLT
+            self._max_volt = _MAX_VOLT
+            self._luts = self._build_luts()
+            # Only now force the next poll to re-read, so a poll racing this
+            # update cannot cache an old-table reading under the current code.
+            self._last_raw_count = None
+        # Re-read now rather than after a (possibly backed-off) sleep.
+        self._wake_event.set()
+
+    def _to_percentage(self, voltage: float) -> int:
+        min_volt = self._min_volt
+        max_volt = self._max_volt
+        if isclose(max_volt, min_volt):
+            return 0
+        pct = (voltage - min_volt) / (max_volt - min_volt) * 100.0
+        return max(0, min(100, int(round(pct))))
+
+    def _build_luts(self) -> tuple:
+        """Return ``(pct_cv, code_lut)`` reading lookups for the current calibration.
+
+        ``pct_cv`` is ``(base_cv, table)``: the table maps centivolts above
+        ``base_cv`` to a percentage across the min..max window. On the SMBus
+        read path ``code_lut`` maps each 8-bit ADC code to its quantized
+        ``(state, fingerprint)`` pair, so a poll does no float math at all.
+        """
+        min_cv = _centivolts(self._min_volt)
+        span = max(0, _centivolts(self._max_volt) - min_cv)
+        pct_cv = (
+            min_cv,
+            bytes(self._to_percentage((min_cv + i) / 100.0) for i in range(span + 1)),
+        )
+        if self._analog_channel is not None:
+            # The Adafruit driver reports 16-bit values; use the centivolt LUT.
+            return pct_cv, None
+        return pct_cv, tuple(self._quantize(raw8 * 257, pct_cv) for raw8 in range(256))
+
+    def _quantize(self, raw: int, pct_cv: tuple) -> tuple:
+        """Return ``((voltage_cv, percentage, raw_cv), fingerprint)`` for ``raw``."""
+        raw_voltage, voltage = self._raw_to_voltages(raw)
+        voltage_cv = _centivolts(voltage)
+        raw_cv = _centivolts(raw_voltage)
+        percentage = _pct_from_cv(pct_cv, voltage_cv)
+        # Centivolt readings plus percentage packed into one int, so change
+        # detection is a single integer compare.
+        fp = (voltage_cv & 0xFFFFFF) << 32 | (raw_cv & 0xFFFFFF) << 8 | percentage
+        return (voltage_cv, percentage, raw_cv), fp
 
     @property
     def scale_base(self) -> float:
@@ -291,48 +559,75 @@ class BatteryMonitor(threading.Thread):
     def calibration_file(self) -> Path:
         return _CAL_FILE
 
-    def _update(self):
+    def _update(self) -> bool:
+        """Poll the ADC once; return True when a changed reading was published."""
         raw = self._read_channel()
-        voltage = self._raw_to_voltage(raw, calibrated=True)
-        voltage = round(voltage, 2)
-        raw_voltage = round(self._raw_to_voltage(raw, calibrated=False), 2)
-        percentage = _to_percentage(voltage)
-        changed = False
-        with self._lock:
-            if (
-                not isclose(self._voltage, voltage, abs_tol=0.01)
-                or not isclose(getattr(self, "_last_raw", raw_voltage), raw_voltage, abs_tol=0.01)
-                or self._percentage != percentage
-            ):
-                changed = True
-            self._voltage = voltage
-            self._percentage = percentage
-            self._last_raw = raw_voltage
-        if changed and event_bus:
-            event_bus.publish(
+        if raw == self._last_raw_count:
+            return False
+        self._last_raw_count = raw
+        pct_cv, code_lut = self._luts
+        if code_lut is not None:
+            state, fp = code_lut[raw >> 8]
+        else:
+            state, fp = self._quantize(raw, pct_cv)
+        self._state = state
+        if fp == self._last_fp:
+            return False
+        self._last_fp = fp
+        voltage_cv, percentage, raw_cv = state
+        publish = self._publish
+        if publish is not None:
+            publish(
                 "battery_status",
                 {
-                    "voltage": voltage,
-                    "raw_voltage": raw_voltage,
+                    "voltage": voltage_cv / 100.0,
+                    "raw_voltage": raw_cv / 100.0,
                     "percentage": percentage,
                 },
             )
+        return True
 
     def run(self):
-        while self._running.is_set():
+        # Schedule on a monotonic deadline so the poll cadence does not drift
+        # with _update() duration, and wake immediately on stop() or a
+        # calibration change. While readings stay unchanged the interval
+        # doubles per poll up to _POLL_MAX_BACKOFF times; any change or wake-up
+        # snaps back to the base rate.
+        update = self._update
+        stopped = self._stop_event.is_set
+        wake = self._wake_event
+        monotonic = time.monotonic
+        interval = self._interval
+        max_backoff = _POLL_MAX_BACKOFF
+        backoff = 1
+        next_t = monotonic()
+        while not stopped():
             try:
-                self._update()
+                if update():
+                    backoff = 1
+                else:
+                    backoff = min(backoff * 2, max_backoff)
             except Exception as exc:
                 logger.error({"evt": "battery_monitor_error", "error": str(exc)})
-            time.sleep(self._interval)
+            next_t += interval * backoff
+            wait = next_t - monotonic()
+            if wait > 0:
+                if wake.wait(wait):
+                    wake.clear()
+                    backoff = 1
+                    next_t = monotonic()
+            else:
+                next_t = monotonic()
 
     def stop(self):
-        self._running.clear()
-        _ACTIVE_MONITORS.discard(self)
+        self._stop_event.set()
+        self._wake_event.set()
+        _release_active_monitor(self)
 
     def close(self):
-        if self._use_smbus and self._bus is not None:
-            close = getattr(self._bus, "close", None)
-            if callable(close):
-                close()
-        _ACTIVE_MONITORS.discard(self)
+        if self._bus is not None:
+            self._bus = None
+            self._read_raw8 = None
+            self._rdwr = None
+            _release_bus()
+        _release_active_monitor(self)
@@ -12,59 +12,199 @@ import Kalman_filter
 import PID
 import time
 import threading
-import imutils
+import queue
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 CAMERA_BACKEND = os.getenv("CAMERA_BACKEND", "auto").strip().lower()
 CAMERA_DEVICE = os.getenv("CAMERA_DEVICE", "/dev/video0")
+CAMERA_ENCODER = os.getenv("CAMERA_ENCODER", "auto").strip().lower()
 
-_STANDBY_PROFILE = {"resolution": (640, 480), "delay": 0.08, "fps": 12}
+StreamProfile = namedtuple("StreamProfile", "name resolution delay fps")
+
+_STANDBY_PROFILE = StreamProfile("STANDBY", (640, 480), 0.08, 12)
 _VIDEO_PROFILES = {
-    "ACTIVE": {"resolution": (640, 480), "delay": 0.0, "fps": 30},
+    "ACTIVE": StreamProfile("ACTIVE", (640, 480), 0.0, 30),
     "STANDBY": _STANDBY_PROFILE,
     "STABILITY": _STANDBY_PROFILE,
-    "ECO": {"resolution": (640, 480), "delay": 0.15, "fps": 5},
-    "ACTIVE_HIGH": {"resolution": (1920, 1080), "delay": 0.0, "fps": 30},
+    "ECO": StreamProfile("ECO", (640, 480), 0.15, 5),
+    "ACTIVE_HIGH": StreamProfile("ACTIVE_HIGH", (1920, 1080), 0.0, 30),
 }
-_current_profile = "ACTIVE"
-_profile_lock = threading.Lock()
+# Rebinding this single reference is atomic, so the per-frame readers need
+# no lock; profiles change at human rates from the control thread.
+_active_profile = _VIDEO_PROFILES["ACTIVE"]
 
 
 def set_stream_profile(name: str) -> None:
-    global _current_profile
+    global _active_profile
     if not name:
         name = "ACTIVE"
-    name = name.upper()
-    if name == "STABILITY":
-        name = "STANDBY"
-    with _profile_lock:
-        _current_profile = name if name in _VIDEO_PROFILES else "ACTIVE"
+    # "STABILITY" is an alias that maps to the STANDBY profile instance.
+    _active_profile = _VIDEO_PROFILES.get(name.upper(), _VIDEO_PROFILES["ACTIVE"])
+
 
+def _get_stream_profile() -> StreamProfile:
+    return _active_profile
 
-def _get_stream_profile() -> dict:
-    with _profile_lock:
-        profile = _VIDEO_PROFILES.get(_current_profile, _VIDEO_PROFILES["ACTIVE"]).copy()
-        profile["name"] = _current_profile
-    return profile
+
+def _pick_interp(src_shape, dst_size):
+    """Nearest-neighbour for preview downscales; INTER_AREA when enlarging."""
+    if dst_size[0] > src_shape[1] or dst_size[1] > src_shape[0]:
+        return cv2.INTER_AREA
+    return cv2.INTER_NEAREST
 
 
 def _transform_frame_for_profile(frame):
     profile = _get_stream_profile()
-    resolution = profile.get("resolution")
-    delay = profile.get("delay", 0.0)
-    if resolution and isinstance(resolution, (tuple, list)) and len(resolution) == 2:
+    resolution = profile.resolution
+    # The capture side is usually configured to the profile size already.
+    if (frame.shape[1], frame.shape[0]) != resolution:
         try:
-            frame = cv2.resize(frame, resolution, interpolation=cv2.INTER_AREA)
+            frame = cv2.resize(frame, resolution, interpolation=_pick_interp(frame.shape, resolution))
         except Exception:
             pass
-    return frame, max(0.0, float(delay))
+    return frame, profile.delay
 
 
 def get_stream_profile() -> dict:
     """Expose current stream profile metadata."""
-    data = _get_stream_profile()
-    resolution = data.get("resolution") or (640, 480)
-    data["resolution"] = resolution
-    data.setdefault("fps", 30)
-    return data
+    return _get_stream_profile()._asdict()
+
+
+class _GstJpegEncoder:
+    """JPEG encoder backed by the Pi's V4L2 hardware codec through GStreamer.
+
+    The stream is served as MJPEG, so frames stay JPEG; only the encoding
+    moves off the CPU. The pipeline is rebuilt whenever the frame shape
+    changes (profile switch). Each pushed frame carries its own PTS and only
+    the sample with that PTS is returned, so pipeline latency can never hand
+    back the previous frame's JPEG.
+    """
+
+    _PIPELINE = (
+        "appsrc name=src is-live=true format=time "
+        "caps=video/x-raw,format=BGR,width={width},height={height},framerate=0/1 "
+        "! videoconvert ! v4l2jpegenc "
+        "! appsink name=sink sync=false max-buffers=1 drop=true"
+    )
+
+    def __init__(self, gst):
+        self._gst = gst
+        self._pipeline = None
+        self._src = None
+        self._sink = None
+        self._shape = None
+        self._last_pts = -1
+
+    def _build(self, shape):
+        self.close()
+        gst = self._gst
+        height, width = shape[:2]
+        pipeline = gst.parse_launch(self._PIPELINE.format(width=width, height=height))
+        if pipeline.set_state(gst.State.PLAYING) == gst.StateChangeReturn.FAILURE:
+            pipeline.set_state(gst.State.NULL)
+            raise RuntimeError("unable to start hardware JPEG pipeline")
+        self._pipeline = pipeline
+        self._src = pipeline.get_by_name("src")
+        self._sink = pipeline.get_by_name("sink")
+        self._shape = shape
+
+    def encode(self, img):
+        if img.shape != self._shape:
+            self._build(img.shape)
+        gst = self._gst
+        buf = gst.Buffer.new_wrapped(img.tobytes())
+        pts = max(time.monotonic_ns(), self._last_pts + 1)
+        self._last_pts = pts
+        buf.pts = pts
+        self._src.emit("push-buffer", buf)
+        deadline = time.monotonic() + 1.0
+        while True:
+            remaining = deadline - time.monotonic()
+            sample = None
+            if remaining > 0:
+                sample = self._sink.emit("try-pull-sample", int(remaining * gst.SECOND))
+            if sample is None:
+                raise RuntimeError("hardware JPEG encoder produced no frame")
+            out = sample.get_buffer()
+            if out.pts == pts:
+                return out.extract_dup(0, out.get_size())
+            # A late JPEG for an earlier frame; discard it and keep waiting.
+
+    def close(self):
+        if self._pipeline is not None:
+            self._pipeline.set_state(self._gst.State.NULL)
+        self._pipeline = None
+        self._src = None
+        self._sink = None
+        self._shape = None
+
+
+def _init_hw_encoder():
+    if CAMERA_ENCODER not in ("auto", "gstreamer"):
+        return False
+    try:
+        import gi
+        gi.require_version("Gst", "1.0")
+        from gi.repository import Gst
+        Gst.init(None)
+    except Exception as exc:
+        print(f"GStreamer unavailable, using software JPEG encoder: {exc}")
+        return False
+    if Gst.ElementFactory.find("v4l2jpegenc") is None:
+        print("No v4l2jpegenc element, using software JPEG encoder.")
+        return False
+    print("Using GStreamer hardware JPEG encoder for video stream.")
+    return _GstJpegEncoder(Gst)
+
+
+def _init_sw_encoder():
+    if CAMERA_ENCODER not in ("auto", "gstreamer", "turbojpeg"):
+        return False
+    try:
+        from turbojpeg import TurboJPEG, TJPF_BGR
+        encoder = TurboJPEG()
+    except Exception as exc:
+        print(f"PyTurboJPEG unavailable, using OpenCV JPEG encoder: {exc}")
+        return False
+    print("Using libjpeg-turbo encoder for video stream.")
+    return lambda img: encoder.encode(img, quality=JPEG_QUALITY, pixel_format=TJPF_BGR)
+
+
+JPEG_QUALITY = 95  # matches the cv2.imencode default
+_hw_encoder = None  # _GstJpegEncoder once probed, False when unavailable
+_hw_failures = 0  # consecutive hardware encode failures
+_HW_MAX_FAILURES = 3  # disable the hardware path after this many in a row
+_sw_encoder = None  # TurboJPEG encode callable once probed, False when unavailable
+
+
+def _encode_jpeg(img):
+    """Encode ``img`` to JPEG bytes: hardware, then libjpeg-turbo, then OpenCV."""
+    global _hw_encoder, _hw_failures, _sw_encoder
+    if _hw_encoder is None:
+        _hw_encoder = _init_hw_encoder()
+    if _hw_encoder:
+        try:
+            jpeg = _hw_encoder.encode(img)
+            _hw_failures = 0
+            return jpeg
+        except Exception as exc:
+            # One slow pull is not fatal: encode this frame in software and
+            # only give up on the hardware path after repeated failures.
+            _hw_failures += 1
+            if _hw_failures >= _HW_MAX_FAILURES:
+                print(f"Hardware JPEG encoder failed {_hw_failures} times, falling back to software: {exc}")
+                _hw_encoder.close()
+                _hw_encoder = False
+    if _sw_encoder is None:
+        _sw_encoder = _init_sw_encoder()
+    if _sw_encoder:
+        try:
+            return _sw_encoder(img)
+        except Exception as exc:
+            print(f"libjpeg-turbo encoder failed, falling back to OpenCV: {exc}")
+            _sw_encoder = False
+    ok, buf = cv2.imencode('.jpg', img)
+    return buf.tobytes() if ok else None
 
 
 pid = PID.PID()
@@ -94,9 +234,22 @@ ImgIsNone = 0
 
 colorUpper = np.array([44, 255, 255])
 colorLower = np.array([24, 100, 100])
+_HSV_SPAN = np.array([15, 150, 150])
+_HSV_MAX = np.array([180, 255, 255])
+
+# Two erode and two dilate passes with a 3x3 kernel reach 4 rows, so a band
+# of that margin around a scanline binarizes it exactly like the full frame.
+_LINE_BAND_MARGIN = 4
 
-def map(input, in_min,in_max,out_min,out_max):
-    return (input-in_min)/(in_max-out_min)*(out_max-out_min)+out_min
+
+def _binarize_row(frame_image, row):
+    """Threshold/erode/dilate only the band around ``row``; return that row."""
+    top = max(row - _LINE_BAND_MARGIN, 0)
+    band = cv2.cvtColor(frame_image[top:row + _LINE_BAND_MARGIN + 1], cv2.COLOR_BGR2GRAY)
+    retval, band = cv2.threshold(band, Threshold, 255, cv2.THRESH_BINARY) # Set the threshold manually and set it to 80.
+    band = cv2.erode(band, None, iterations=2)
+    band = cv2.dilate(band, None, iterations=2)
+    return band[row - top]
 
 class CVThread(threading.Thread):
     font = cv2.FONT_HERSHEY_SIMPLEX
@@ -116,6 +269,8 @@ class CVThread(threading.Thread):
     Y_lock = 0
     X_lock = 0
     tor = 17
+    watchScale = 4 # watchDog motion detection downscale factor
+    _OPEN_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
 
     scGear = RPIservo.ServoCtrl()
     scGear.moveInit()
@@ -125,9 +280,7 @@ class CVThread(threading.Thread):
     # switch.switchSetup()
 
     def __init__(self, *args, **kwargs):
-        self.CVThreading = 0
         self.CVMode = 'none'
-        self.imgCV = None
 
         self.mov_x = None
         self.mov_y = None
@@ -140,6 +293,8 @@ class CVThread(threading.Thread):
         self.drawing = 0
 
         self.findColorDetection = 0
+        self._hsv = None
+        self._mask = None
 
         self.left_Pos1 = None
         self.right_Pos1 = None
@@ -158,9 +313,9 @@ class CVThread(threading.Thread):
         self.servo_right_stop = 0
 
         super(CVThread, self).__init__(*args, **kwargs)
-        self.__flag = threading.Event()
-        # self.__flag = Event()
-        self.__flag.clear()
+        # Single-slot frame handoff: while a frame is being processed at most
+        # one more waits, and anything newer is dropped.
+        self._q = queue.Queue(maxsize=1)
 
         self.avg = None
         self.motionCounter = 0
@@ -171,8 +326,17 @@ class CVThread(threading.Thread):
 
     def mode(self, invar, imgInput):
         self.CVMode = invar
-        self.imgCV = imgInput
-        self.resume()
+        if self._q.full():
+            return
+        try:
+            # Frames are copied on handoff: the capture loop refills its two
+            # persistent buffers, so a shared reference would be overwritten
+            # under the worker. Costs one full-frame copy (~900 KB at 640x480
+            # BGR) per handed-off frame; frames dropped while the slot is
+            # full are never copied.
+            self._q.put_nowait(imgInput.copy())
+        except queue.Full:
+            pass
 
     def elementDraw(self,imgInput):
         if self.CVMode == 'none':
@@ -207,7 +371,8 @@ class CVThread(threading.Thread):
                 else:
                     cv2.putText(imgInput,('Following Black Line'),(30,50), cv2.FONT_HERSHEY_SIMPLEX, 0.5,(128,255,128),1,cv2.LINE_AA)
                 
-                imgInput=cv2.merge((imgInput.copy(),imgInput.copy(),imgInput.copy()))
+                if imgInput.ndim == 2:
+                    imgInput = cv2.cvtColor(imgInput, cv2.COLOR_GRAY2BGR)
                 cv2.line(imgInput,(self.left_Pos1,(linePos_1+30)),(self.left_Pos1,(linePos_1-30)),(255,128,64),2)
                 cv2.line(imgInput,(self.right_Pos1,(linePos_1+30)),(self.right_Pos1,(linePos_1-30)),(64,128,255),2)
                 cv2.line(imgInput,(0,linePos_1),(640,linePos_1),(255,128,64),1)
@@ -231,10 +396,15 @@ class CVThread(threading.Thread):
 
     def watchDog(self, imgInput):
         timestamp = datetime.datetime.now()
-        gray = cv2.cvtColor(imgInput, cv2.COLOR_BGR2GRAY)
-        gray = cv2.GaussianBlur(gray, (21, 21), 0)
-
-        if self.avg is None:
+        # Detect motion on a 4x downscaled frame (1/16 of the pixels, so the
+        # 21x21 blur shrinks to 5x5) and scale the bounding box back up.
+        scale = CVThread.watchScale
+        height, width = imgInput.shape[:2]
+        small = cv2.resize(imgInput, (width // scale, height // scale), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        gray = cv2.GaussianBlur(gray, (5, 5), 0)
+
+        if self.avg is None or self.avg.shape != gray.shape:
             print("[INFO] starting background model...")
             self.avg = gray.copy().astype("float")
             return 'background model'
@@ -246,20 +416,27 @@ class CVThread(threading.Thread):
         # in holes, then find contours on thresholded image
         self.thresh = cv2.threshold(self.frameDelta, 5, 255,
             cv2.THRESH_BINARY)[1]
-        self.thresh = cv2.dilate(self.thresh, None, iterations=2)
-        self.cnts = cv2.findContours(self.thresh.copy(), cv2.RETR_EXTERNAL,
-            cv2.CHAIN_APPROX_SIMPLE)
-        self.cnts = imutils.grab_contours(self.cnts)
+        if not cv2.countNonZero(self.thresh):
+            # Idle frame: nothing changed, skip dilation and contour tracing.
+            self.cnts = []
+        else:
+            self.thresh = cv2.dilate(self.thresh, None, iterations=2)
+            # OpenCV >= 3.2 leaves the input untouched; [-2] picks the
+            # contours on both the 3.x and 4.x return signatures.
+            self.cnts = cv2.findContours(self.thresh, cv2.RETR_EXTERNAL,
+                cv2.CHAIN_APPROX_SIMPLE)[-2]
+        min_area = 5000 / (scale * scale)
         # print('x')
         # loop over the contours
         for c in self.cnts:
             # if the contour is too small, ignore it
-            if cv2.contourArea(c) < 5000:
+            if cv2.contourArea(c) < min_area:
                 continue
      
             # compute the bounding box for the contour, draw it on the frame,
             # and update the text
-            (self.mov_x, self.mov_y, self.mov_w, self.mov_h) = cv2.boundingRect(c)
+            (x, y, w, h) = cv2.boundingRect(c)
+            (self.mov_x, self.mov_y, self.mov_w, self.mov_h) = (x * scale, y * scale, w * scale, h * scale)
             self.drawing = 1
             
             self.motionCounter += 1
@@ -269,7 +446,6 @@ class CVThread(threading.Thread):
 
         if (timestamp - self.lastMovtionCaptured).seconds >= 0.5:
             self.drawing = 0
-        self.pause()
 
 
     # def findLineCtrl(self, posInput, setCenter):
@@ -326,19 +502,16 @@ class CVThread(threading.Thread):
 
 
     def findlineCV(self, frame_image):
-        frame_findline = cv2.cvtColor(frame_image, cv2.COLOR_BGR2GRAY)
-        retval, frame_findline =  cv2.threshold(frame_findline, Threshold, 255, cv2.THRESH_BINARY) # Set the threshold manually and set it to 80.
-        frame_findline = cv2.erode(frame_findline, None, iterations=2)
-        frame_findline = cv2.dilate(frame_findline, None, iterations=2)
-        colorPos_1 = frame_findline[linePos_1]
-        colorPos_2 = frame_findline[linePos_2]
+        colorPos_1 = _binarize_row(frame_image, linePos_1)
+        colorPos_2 = _binarize_row(frame_image, linePos_2)
         
         try:
-            lineColorCount_Pos1 = np.sum(colorPos_1 == lineColorSet)
-            lineColorCount_Pos2 = np.sum(colorPos_2 == lineColorSet)
+            # One compare-and-scan per row; the match count is the index size.
+            lineIndex_Pos1 = np.nonzero(colorPos_1 == lineColorSet)
+            lineIndex_Pos2 = np.nonzero(colorPos_2 == lineColorSet)
 
-            lineIndex_Pos1 = np.where(colorPos_1 == lineColorSet)
-            lineIndex_Pos2 = np.where(colorPos_2 == lineColorSet)
+            lineColorCount_Pos1 = lineIndex_Pos1[0].size
+            lineColorCount_Pos2 = lineIndex_Pos2[0].size
 
             # Roughly judge whether there is a color to track.
             if lineIndex_Pos1 !=[]:
@@ -375,7 +548,6 @@ class CVThread(threading.Thread):
             pass
 
         self.findLineCtrl(self.center)
-        self.pause()
 
 
     def servoMove(ID, Dir, errorInput):
@@ -401,10 +573,12 @@ class CVThread(threading.Thread):
             print('No servoPort %d assigned.'%ID)
 
     def findColor(self, frame_image):
-        hsv = cv2.cvtColor(frame_image, cv2.COLOR_BGR2HSV)
-        mask = cv2.inRange(hsv, colorLower, colorUpper)#1
-        mask = cv2.erode(mask, None, iterations=2)
-        mask = cv2.dilate(mask, None, iterations=2)
+        # Convert and threshold into buffers kept across frames; OpenCV only
+        # reallocates them when the frame size changes.
+        hsv = self._hsv = cv2.cvtColor(frame_image, cv2.COLOR_BGR2HSV, dst=self._hsv)
+        mask = self._mask = cv2.inRange(hsv, colorLower, colorUpper, dst=self._mask)#1
+        # Two 3x3 erodes then two 3x3 dilates == one opening with a 5x5 rect.
+        cv2.morphologyEx(mask, cv2.MORPH_OPEN, CVThread._OPEN_KERNEL, dst=mask)
         cnts = cv2.findContours(mask.copy(), cv2.RETR_EXTERNAL,
             cv2.CHAIN_APPROX_SIMPLE)[-2]
         center = None
@@ -423,34 +597,21 @@ class CVThread(threading.Thread):
         else:
             self.findColorDetection = 0
             # move.motorStop()
-        self.pause()
-
 
-    def pause(self):
-        self.__flag.clear()
-
-    def resume(self):
-        self.__flag.set()
 
     def run(self):
         while 1:
-            self.__flag.wait()
+            img = self._q.get()
             if self.CVMode == 'none':
                 continue
             
             elif self.CVMode == 'findColor':
-                self.CVThreading = 1
-                self.findColor(self.imgCV)
-                self.CVThreading = 0
+                self.findColor(img)
             elif self.CVMode == 'findlineCV':
-                self.CVThreading = 1
                 # Camera.CVRunSet(1)
-                self.findlineCV(self.imgCV)
-                self.CVThreading = 0
+                self.findlineCV(img)
             elif self.CVMode == 'watchDog':
-                self.CVThreading = 1
-                self.watchDog(self.imgCV)
-                self.CVThreading = 0
+                self.watchDog(img)
             else:
                 pass
 
@@ -460,26 +621,12 @@ class Camera(BaseCamera):
     modeSelect = 'none'
 
     def colorFindSet(self, invarH, invarS, invarV):
-        global colorUpper, colorLower
-        HUE_1 = invarH+15
-        HUE_2 = invarH-15
-        if HUE_1>180:HUE_1=180
-        if HUE_2<0:HUE_2=0
-
-        SAT_1 = invarS+150
-        SAT_2 = invarS-150
-        if SAT_1>255:SAT_1=255
-        if SAT_2<0:SAT_2=0
-
-        VAL_1 = invarV+150
-        VAL_2 = invarV-150
-        if VAL_1>255:VAL_1=255
-        if VAL_2<0:VAL_2=0
-
-        colorUpper = np.array([HUE_1, SAT_1, VAL_1])
-        colorLower = np.array([HUE_2, SAT_2, VAL_2])
-        print('HSV_1:%d %d %d'%(HUE_1, SAT_1, VAL_1))
-        print('HSV_2:%d %d %d'%(HUE_2, SAT_2, VAL_2))
+        # Update the bounds in place so findColor keeps the same arrays.
+        hsv = np.array([invarH, invarS, invarV])
+        np.minimum(hsv + _HSV_SPAN, _HSV_MAX, out=colorUpper, casting='unsafe')
+        np.maximum(hsv - _HSV_SPAN, 0, out=colorLower, casting='unsafe')
+        print('HSV_1:%d %d %d'%tuple(colorUpper))
+        print('HSV_2:%d %d %d'%tuple(colorLower))
         print(colorUpper)
         print(colorLower)
 
@@ -533,7 +680,7 @@ class Camera(BaseCamera):
 
         def stream_from_picamera2():
             try:
-                from picamera2 import Picamera2
+                from picamera2 import Picamera2, MappedArray
                 import libcamera
             except Exception as exc:
                 raise RuntimeError(f"Picamera2 module unavailable: {exc}") from exc
@@ -542,13 +689,13 @@ class Camera(BaseCamera):
             transform = libcamera.Transform(hflip=hflip, vflip=vflip)
             configs = {}
             current_config = None
+            frame_size = None
 
             def build_config(key):
                 if key in configs:
                     return configs[key]
                 is_high = key == "high"
-                resolution = _VIDEO_PROFILES["ACTIVE_HIGH" if is_high else "ACTIVE"]["resolution"]
-                size = tuple(resolution)
+                size = _VIDEO_PROFILES["ACTIVE_HIGH" if is_high else "ACTIVE"].resolution
                 factory = picam2.create_video_configuration if is_high else picam2.create_preview_configuration
                 configs[key] = factory(
                     main={"size": size, "format": "RGB888"},
@@ -557,10 +704,8 @@ class Camera(BaseCamera):
                 return configs[key]
 
             def ensure_profile():
-                nonlocal current_config
-                profile = _get_stream_profile()
-                profile_name = profile.get("name", "ACTIVE").upper()
-                target_key = "high" if profile_name == "ACTIVE_HIGH" else "default"
+                nonlocal current_config, frame_size
+                target_key = "high" if _get_stream_profile().name == "ACTIVE_HIGH" else "default"
                 if target_key == current_config:
                     return
                 config = build_config(target_key)
@@ -572,14 +717,32 @@ class Camera(BaseCamera):
                 picam2.configure(config)
                 picam2.start()
                 current_config = target_key
+                frame_size = tuple(config["main"]["size"])
 
             ensure_profile()
             print("Using Picamera2 backend for video stream.")
 
+            # Frames are copied out of the DMA buffer into persistent arrays
+            # instead of a fresh allocation per capture. Two buffers alternate
+            # because the previous frame may still be encoding while the next
+            # one is captured.
+            frame_bufs = [None, None]
+            slot = 0
             while True:
                 ensure_profile()
-                img = picam2.capture_array()
-                yield img
+                request = picam2.capture_request()
+                try:
+                    with MappedArray(request, "main") as mapped:
+                        width, height = frame_size
+                        src = mapped.array[:height, :width]
+                        frame_buf = frame_bufs[slot]
+                        if frame_buf is None or frame_buf.shape != src.shape:
+                            frame_buf = frame_bufs[slot] = np.empty(src.shape, dtype=src.dtype)
+                        np.copyto(frame_buf, src)
+                finally:
+                    request.release()
+                slot ^= 1
+                yield frame_buf
 
         def stream_from_opencv():
             # Allow numeric or explicit device path.
@@ -588,33 +751,38 @@ class Camera(BaseCamera):
                 source_to_use = int(source)
             else:
                 source_to_use = source
-            cap = cv2.VideoCapture(source_to_use)
+            # Prefer the V4L2 backend directly; fall back to OpenCV's choice.
+            cap = cv2.VideoCapture(source_to_use, cv2.CAP_V4L2)
+            if not cap.isOpened():
+                cap = cv2.VideoCapture(source_to_use)
             if not cap.isOpened():
                 raise RuntimeError(f"Unable to open camera device {source_to_use}")
+            # Keep a single driver buffer so a slow consumer gets the newest
+            # frame rather than one queued behind stale captures.
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             current_profile = None
 
             def apply_profile():
                 nonlocal current_profile
                 profile = _get_stream_profile()
-                profile_name = profile.get("name", "ACTIVE").upper()
-                if profile_name == current_profile:
+                if profile is current_profile:
                     return
-                resolution = tuple(profile.get("resolution") or _VIDEO_PROFILES["ACTIVE"]["resolution"])
-                fps = profile.get("fps") or _VIDEO_PROFILES["ACTIVE"]["fps"]
-                cap.set(cv2.CAP_PROP_FRAME_WIDTH, resolution[0])
-                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, resolution[1])
-                cap.set(cv2.CAP_PROP_FPS, fps)
-                current_profile = profile_name
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, profile.resolution[0])
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, profile.resolution[1])
+                cap.set(cv2.CAP_PROP_FPS, profile.fps)
+                current_profile = profile
 
             apply_profile()
             cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             print(f"Using OpenCV backend for video stream on {source_to_use}.")
             while True:
                 apply_profile()
-                ret, frame = cap.read()
-                if not ret:
+                if not cap.grab():
                     time.sleep(0.05)
                     continue
+                ret, frame = cap.retrieve()
+                if not ret:
+                    continue
                 yield frame
 
         generators = []
@@ -633,6 +801,11 @@ class Camera(BaseCamera):
 
         active_name, active_gen = generators[0]
 
+        # JPEG encoding runs one frame behind on its own thread (OpenCV and
+        # GStreamer release the GIL), overlapping with the next capture.
+        encode_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jpeg-encode")
+        pending = None
+
         while True:
             try:
                 img = next(active_gen)
@@ -662,14 +835,9 @@ class Camera(BaseCamera):
 
             if Camera.modeSelect == 'none':
                 # switch.switch(1,0)
-                cvt.pause()
+                pass
             else:
-                if cvt.CVThreading:
-                    pass
-                else:
-                    pass
-                    cvt.mode(Camera.modeSelect, img)
-                    cvt.resume()
+                cvt.mode(Camera.modeSelect, img)
                 try:
                     pass
                     img = cvt.elementDraw(img)
@@ -677,9 +845,12 @@ class Camera(BaseCamera):
                     pass
             
             img, profile_delay = _transform_frame_for_profile(img)
-            encoded = cv2.imencode('.jpg', img)
-            if encoded[0]:
-                yield encoded[1].tobytes()
+            future = encode_pool.submit(_encode_jpeg, img)
+            if pending is not None:
+                encoded = pending.result()
+                if encoded is not None:
+                    yield encoded
+            pending = future
             if profile_delay:
                 remaining = profile_delay - (time.time() - start_time)
                 if remaining > 0:
@@ -3,43 +3,171 @@
 
 from __future__ import annotations
 
+import json
 import queue
 import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+# Back-pressure policies for listeners that fall a full ring behind. The
+# publisher never blocks; the policy only decides what the slow reader sees.
+DROP_OLDEST = "drop_oldest"  # resume at the oldest message still retained
+DROP_BACKLOG = "drop_backlog"  # discard the backlog and resume at the newest
+RAISE = "raise"  # surface Lagged from get() to the caller
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_BACKLOG, RAISE)
+
+
+def format_sse(event_type: str, payload: Any) -> str:
+    """Render one server-sent event frame."""
+    return f"event: {event_type}\ndata: {json.dumps(payload)}\n\n"
+
+
+class Event:
+    """Immutable-by-convention message stored in the ring."""
+
+    __slots__ = ("type", "payload", "ts_ns", "_sse")
+
+    def __init__(self, event_type: str, payload: Dict[str, Any], ts_ns: int) -> None:
+        self.type = event_type
+        self.payload = payload
+        self.ts_ns = ts_ns
+        self._sse: Optional[str] = None
+
+    @property
+    def sse(self) -> str:
+        """SSE frame for this event, serialized once and shared by all clients."""
+        frame = self._sse
+        if frame is None:
+            frame = self._sse = format_sse(self.type, self.payload)
+        return frame
+
+    @property
+    def ts(self) -> float:
+        """Wall-clock publish time in seconds, derived on demand."""
+        return self.ts_ns / 1e9
+
+
+class Lagged(Exception):
+    """Raised when a subscriber fell behind and ring slots were overwritten."""
+
+    def __init__(self, missed: int) -> None:
+        super().__init__(f"subscriber lagged by {missed} messages")
+        self.missed = missed
+
+
+class Subscription:
+    """Per-listener read cursor into the shared :class:`EventBus` ring."""
+
+    def __init__(self, bus: "EventBus", cursor: int, policy: str = DROP_OLDEST) -> None:
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {policy!r}")
+        self._bus = bus
+        self._cursor = cursor
+        self.policy = policy
+        self.missed = 0
+
+    def try_recv(self) -> Optional[Event]:
+        """Return the next message without blocking, or ``None`` if caught up.
+
+        Raises :class:`Lagged` (after resyncing to the oldest retained
+        message) when the publisher lapped this cursor.
+        """
+        bus = self._bus
+        cursor = self._cursor
+        if cursor >= bus._head:
+            return None
+        seq, message = bus._slots[cursor & bus._mask]
+        if seq != cursor:
+            # Slot was overwritten by a newer lap; skip to the oldest survivor.
+            oldest = max(bus._head - bus._capacity, 0)
+            self._cursor = oldest
+            raise Lagged(oldest - cursor)
+        self._cursor = cursor + 1
+        return message
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Event:
+        """Queue-compatible read; lagged messages are counted in ``missed``.
+
+        How a lag is handled depends on the subscription's overflow policy.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                message = self.try_recv()
+            except Lagged as exc:
+                if self.policy == DROP_BACKLOG:
+                    # Skip to the newest retained message, which is delivered.
+                    newest = self._bus._head - 1
+                    backlog = newest - self._cursor
+                    self._cursor = newest
+                    self.missed += exc.missed + backlog
+                    continue
+                self.missed += exc.missed
+                if self.policy == RAISE:
+                    raise
+                continue
+            if message is not None:
+                return message
+            if not block:
+                raise queue.Empty
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+            self._bus._wait_for(self._cursor, remaining)
+
+    def get_nowait(self) -> Event:
+        return self.get(block=False)
 
 
 class EventBus:
-    """Publish/subscribe helper for SSE endpoints."""
+    """Publish/subscribe helper for SSE endpoints.
+
+    Published messages land in a single pre-allocated ring; each listener
+    walks it with its own cursor, so publishing costs one slot store no
+    matter how many SSE clients are attached.
+    """
 
-    def __init__(self) -> None:
-        self._listeners: set[queue.Queue] = set()
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a positive power of two")
+        self._capacity = capacity
+        self._mask = capacity - 1
+        # Each slot holds a (sequence, message) pair stored in one assignment
+        # so readers never observe a stamp from one lap with data from another.
+        self._slots: list = [(-1, None)] * capacity
+        self._head = 0
+        # Copy-on-write: mutated under the lock, read lock-free by publish().
+        self._listeners: tuple[Subscription, ...] = ()
         self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
 
-    def listen(self) -> queue.Queue:
-        q: queue.Queue = queue.Queue()
+    def listen(self, policy: str = DROP_OLDEST) -> Subscription:
         with self._lock:
-            self._listeners.add(q)
-        return q
+            subscription = Subscription(self, self._head, policy)
+            self._listeners = self._listeners + (subscription,)
+        return subscription
 
-    def remove(self, q: queue.Queue) -> None:
+    def remove(self, subscription: Subscription) -> None:
         with self._lock:
-            self._listeners.discard(q)
+            self._listeners = tuple(s for s in self._listeners if s is not subscription)
 
     def publish(self, event_type: str, payload: Dict[str, Any]) -> None:
-        message = {
-            "type": event_type,
-            "payload": payload,
-            "ts": time.time(),
-        }
-        with self._lock:
-            listeners = list(self._listeners)
-        for listener in listeners:
-            try:
-                listener.put_nowait(message)
-            except queue.Full:
-                # Drop messages if a listener falls behind; avoids blocking publishers.
-                continue
+        if not self._listeners:
+            # Nobody is attached; new subscribers start at the head anyway.
+            return
+        message = Event(event_type, payload, time.time_ns())
+        with self._cond:
+            head = self._head
+            self._slots[head & self._mask] = (head, message)
+            self._head = head + 1
+            self._cond.notify_all()
+
+    def _wait_for(self, cursor: int, timeout: Optional[float]) -> None:
+        with self._cond:
+            if cursor >= self._head:
+                self._cond.wait(timeout)
 
 
 event_bus = EventBus()
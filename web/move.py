@@ -5,12 +5,15 @@
 # Website     : www.adeept.com
 # Author      : Adeept
 # Date        : 2025/03/10
+import functools
 import time
 
 try:
     from events import event_bus as _event_bus
 except Exception:
     _event_bus = None
+# Bound once at import; move() publishes on every teleop update.
+_bus_publish = _event_bus.publish if _event_bus is not None else None
 
 try:
     from board import SCL, SDA
@@ -35,6 +38,9 @@ MOTOR_M3_IN1 = 11      # Define the positive pole of M3
 MOTOR_M3_IN2 = 10      # Define the negative pole of M3
 MOTOR_M4_IN1 = 8       # Define the positive pole of M4
 MOTOR_M4_IN2 = 9       # Define the negative pole of M4
+# M1-M4 occupy the contiguous block of channels 8-15.
+_MOTOR_FIRST_CHANNEL = 8
+_MOTOR_CHANNEL_COUNT = 8
 
 M1_Direction = 1
 M2_Direction = 1
@@ -58,6 +64,16 @@ motor3 = None
 motor4 = None
 pwm_motor = None
 _use_fallback = False
+_MOTORS = (None, None, None, None)  # (motor1, motor2, motor3, motor4)
+# Per-motor throttle callables indexed by channel - 1 in Motor(); fallback
+# motors expose set_throttle() directly, skipping the property descriptor.
+_THROTTLE_SETTERS = (None, None, None, None)
+# Last throttle written per motor. Motor() skips repeats, since each write
+# costs two PCA9685 register transfers over I2C.
+_last_throttle = [None, None, None, None]
+# setup() verifies the PWM frequency once per driver; reading it back on the
+# Adafruit driver is an I2C round trip and returns an inexact float.
+_pwm_freq_set = False
 
 
 class _FallbackDCMotor:
@@ -67,6 +83,11 @@ class _FallbackDCMotor:
         self._driver = driver
         self._channel_a = channel_a
         self._channel_b = channel_b
+        # Register offsets are fixed per motor; the H-bridge inputs sit on
+        # adjacent channels, so both are normally written in one block.
+        self._reg_a = driver.LED0_ON_L + 4 * channel_a
+        self._reg_b = driver.LED0_ON_L + 4 * channel_b
+        self._paired = abs(channel_a - channel_b) == 1
         self._throttle = 0.0
         self.decay_mode = None
 
@@ -76,21 +97,30 @@ class _FallbackDCMotor:
 
     @throttle.setter
     def throttle(self, value):
+        self.set_throttle(value)
+
+    def set_throttle(self, value):
+        """Plain-method form of the throttle setter, used by Motor()."""
         if value is None:
             value = 0.0
         value = max(-1.0, min(1.0, float(value)))
         self._throttle = value
         duty = int(round(abs(value) * 4095))
         if duty <= 0:
-            self._driver.set_pwm(self._channel_a, 0, 0)
-            self._driver.set_pwm(self._channel_b, 0, 0)
-            return
-        if value > 0:
-            self._driver.set_pwm(self._channel_a, 0, duty)
-            self._driver.set_pwm(self._channel_b, 0, 0)
+            self._write(0, 0)
+        elif value > 0:
+            self._write(duty, 0)
         else:
-            self._driver.set_pwm(self._channel_a, 0, 0)
-            self._driver.set_pwm(self._channel_b, 0, duty)
+            self._write(0, duty)
+
+    def _write(self, duty_a, duty_b):
+        if not self._paired:
+            self._driver.set_pwm_reg(self._reg_a, 0, duty_a)
+            self._driver.set_pwm_reg(self._reg_b, 0, duty_b)
+        elif self._reg_a < self._reg_b:
+            self._driver.set_pwm_pair(self._reg_a, duty_a, duty_b)
+        else:
+            self._driver.set_pwm_pair(self._reg_b, duty_b, duty_a)
 
     def release(self):
         self.throttle = 0.0
@@ -106,14 +136,11 @@ Motor interface.
 '''
 
 
-def map(x, in_min, in_max, out_min, out_max):
-    return (x - in_min) / (in_max - in_min) * (out_max - out_min) + out_min
-
-
 def _ensure_driver():
-    global motor1, motor2, motor3, motor4, pwm_motor, _use_fallback
+    global motor1, motor2, motor3, motor4, pwm_motor, _use_fallback, _MOTORS, _THROTTLE_SETTERS
     if pwm_motor is not None:
         return
+    _last_throttle[:] = (None, None, None, None)
     fallback_reason = None
     if _HAVE_ADAFRUIT:
         try:
@@ -130,6 +157,10 @@ def _ensure_driver():
             motor4.decay_mode = adafruit_motor.SLOW_DECAY
             pwm_motor = pwm
             _use_fallback = False
+            _MOTORS = (motor1, motor2, motor3, motor4)
+            _THROTTLE_SETTERS = tuple(
+                functools.partial(setattr, motor, "throttle") for motor in _MOTORS
+            )
             announce_driver("motors", "adafruit")
             return
         except Exception as exc:
@@ -138,25 +169,40 @@ def _ensure_driver():
             fallback_reason = exc
     else:
         fallback_reason = Exception("Blinka not available")
-    pwm = _SMBusPCA9685(address=0x5f, frequency=FREQ)
+    pwm = _SMBusPCA9685(addr=0x5f, freq=FREQ)
     motor1 = _FallbackDCMotor(pwm, MOTOR_M1_IN1, MOTOR_M1_IN2)
     motor2 = _FallbackDCMotor(pwm, MOTOR_M2_IN1, MOTOR_M2_IN2)
     motor3 = _FallbackDCMotor(pwm, MOTOR_M3_IN1, MOTOR_M3_IN2)
     motor4 = _FallbackDCMotor(pwm, MOTOR_M4_IN1, MOTOR_M4_IN2)
     pwm_motor = pwm
     _use_fallback = True
+    _MOTORS = (motor1, motor2, motor3, motor4)
+    _THROTTLE_SETTERS = tuple(motor.set_throttle for motor in _MOTORS)
     announce_driver("motors", "smbus", fallback_reason)
 
 
 def setup():  # Motor initialization
+    global _pwm_freq_set
     _ensure_driver()
+    if _pwm_freq_set:
+        return
     if pwm_motor.frequency != FREQ:
         pwm_motor.frequency = FREQ
+    _pwm_freq_set = True
 
 
 def motorStop():  # Motor stops
     if pwm_motor is None:
         return
+    if _use_fallback:
+        # One block write zeroes all eight motor inputs; the servo and LED
+        # channels sharing the chip are left alone (unlike ALL_LED_OFF).
+        pwm_motor.off_channels(_MOTOR_FIRST_CHANNEL, _MOTOR_CHANNEL_COUNT)
+        for motor in _MOTORS:
+            motor._throttle = 0.0
+        _last_throttle[:] = (0, 0, 0, 0)
+        _publish_motion_event(False)
+        return
     if motor1:
         motor1.throttle = 0
     if motor2:
@@ -165,28 +211,21 @@ def motorStop():  # Motor stops
         motor3.throttle = 0
     if motor4:
         motor4.throttle = 0
+    _last_throttle[:] = (0, 0, 0, 0)
     _publish_motion_event(False)
 
 
 def Motor(channel, direction, motor_speed):
     _ensure_driver()
-    if motor_speed > 100:
-        motor_speed = 100
-    elif motor_speed < 0:
-        motor_speed = 0
-
-    speed = map(motor_speed, 0, 100, 0, 1.0)
-    pwm_motor.frequency = FREQ
+    # Clamp to 0..100 and scale to a 0..1 throttle in one expression.
+    speed = max(0, min(100, motor_speed)) / 100.0
     if direction == -1:
         speed = -speed
-    if channel == 1:
-        motor1.throttle = speed
-    elif channel == 2:
-        motor2.throttle = speed
-    elif channel == 3:
-        motor3.throttle = speed
-    elif channel == 4:
-        motor4.throttle = speed
+    if 1 <= channel <= 4:
+        index = channel - 1
+        if _last_throttle[index] != speed:
+            _THROTTLE_SETTERS[index](speed)
+            _last_throttle[index] = speed
 
 
 def move(speed, direction, turn, radius=0.6):   # 0 < radius <= 1
@@ -214,7 +253,7 @@ def move(speed, direction, turn, radius=0.6):   # 0 < radius <= 1
 
 
 def destroy():
-    global motor1, motor2, motor3, motor4, pwm_motor
+    global motor1, motor2, motor3, motor4, pwm_motor, _MOTORS, _THROTTLE_SETTERS, _pwm_freq_set
     motorStop()
     if pwm_motor:
         try:
@@ -222,6 +261,10 @@ def destroy():
         except AttributeError:
             pass
     motor1 = motor2 = motor3 = motor4 = None
+    _MOTORS = (None, None, None, None)
+    _THROTTLE_SETTERS = (None, None, None, None)
+    _last_throttle[:] = (None, None, None, None)
+    _pwm_freq_set = False
     pwm_motor = None
 
 
@@ -266,10 +309,10 @@ def video_Tracking_Move(speed, direction, turn, radius=0):
 
 
 def _publish_motion_event(active: bool) -> None:
-    if _event_bus is None:
+    if _bus_publish is None:
         return
     try:
-        _event_bus.publish("drive_motion", {"active": bool(active)})
+        _bus_publish("drive_motion", {"active": bool(active)})
     except Exception:
         pass
 
@@ -5,7 +5,7 @@ Helpers for working with the PCA9685 controller across BlinkA and raw smbus.
 from __future__ import annotations
 
 import time
-from typing import Optional
+from typing import Optional, Sequence, Tuple
 
 try:
     from smbus2 import SMBus  # type: ignore
@@ -37,6 +37,9 @@ def us_to_ticks(us: float, freq: int = 50) -> int:
 
 _ANNOUNCED = {}
 
+# PCA9685 internal oscillator divided by the 12-bit counter period.
+_OSC_TICK_HZ = 25_000_000 / 4096
+
 
 def announce_driver(context: str, driver: str, reason: Optional[Exception] = None) -> None:
     """
@@ -69,6 +72,7 @@ class _SMBusPCA9685:
     ALL_LED_OFF_L = 0xFC
     RESTART = 0x80
     SLEEP = 0x10
+    AI = 0x20  # register auto-increment, required for block writes
     ALLCALL = 0x01
     OUTDRV = 0x04
 
@@ -91,22 +95,59 @@ class _SMBusPCA9685:
     def set_pwm_freq(self, freq: int) -> None:
         if freq <= 0:
             raise ValueError("Frequency must be positive.")
-        prescale = int(round(25_000_000 / 4096 / freq - 1))
+        # The chip only accepts prescale values 3..255 (~1526 Hz down to ~24 Hz).
+        prescale = max(3, min(255, int(round(_OSC_TICK_HZ / freq - 1))))
         # Go to sleep, set prescale, then wake and restart.
-        self._write8(self.MODE1, self.SLEEP | self.ALLCALL)
+        self._write8(self.MODE1, self.SLEEP | self.AI | self.ALLCALL)
         time.sleep(0.005)
         self._write8(self.PRESCALE, prescale)
-        self._write8(self.MODE1, self.ALLCALL)
+        self._write8(self.MODE1, self.AI | self.ALLCALL)
         time.sleep(0.005)
-        self._write8(self.MODE1, self.ALLCALL | self.RESTART)
-        self._write8(self.MODE2, self.OUTDRV)
+        # MODE2 follows MODE1 and AI is set, so restart and output mode share
+        # one block write.
+        self._bus.write_i2c_block_data(
+            self.address, self.MODE1, [self.AI | self.ALLCALL | self.RESTART, self.OUTDRV]
+        )
         self._frequency = freq
 
     def set_pwm(self, channel: int, on: int, off: int) -> None:
-        reg = self.LED0_ON_L + 4 * channel
+        self.set_pwm_reg(self.LED0_ON_L + 4 * channel, on, off)
+
+    def set_pwm_reg(self, reg: int, on: int, off: int) -> None:
+        """Like :meth:`set_pwm`, but takes a precomputed LEDn_ON_L register."""
         data = [on & 0xFF, on >> 8, off & 0xFF, off >> 8]
         self._bus.write_i2c_block_data(self.address, reg, data)
 
+    def set_pwm_pair(self, reg: int, off_first: int, off_second: int) -> None:
+        """Set two adjacent channels starting at ``reg`` in one 8-byte block write."""
+        data = [
+            0, 0, off_first & 0xFF, off_first >> 8,
+            0, 0, off_second & 0xFF, off_second >> 8,
+        ]
+        self._bus.write_i2c_block_data(self.address, reg, data)
+
+    def set_pwm_bulk(self, start_channel: int, pairs: Sequence[Tuple[int, int]]) -> None:
+        """Set consecutive channels from ``start_channel`` to ``(on, off)`` pairs.
+
+        Register auto-increment lets one block write cover several channels;
+        SMBus blocks carry at most 32 bytes, so writes are split every 8.
+        """
+        reg = self.LED0_ON_L + 4 * start_channel
+        for base in range(0, len(pairs), 8):
+            data = []
+            for on, off in pairs[base:base + 8]:
+                data += (on & 0xFF, on >> 8, off & 0xFF, off >> 8)
+            self._bus.write_i2c_block_data(self.address, reg + 4 * base, data)
+
+    def off_channels(self, first: int, count: int) -> None:
+        """Zero ``count`` consecutive channels from ``first`` in one block write.
+
+        SMBus block writes carry at most 32 bytes, so ``count`` is capped at 8.
+        """
+        if not 0 < count <= 8:
+            raise ValueError("count must be between 1 and 8.")
+        self._bus.write_i2c_block_data(self.address, self.LED0_ON_L + 4 * first, [0] * (4 * count))
+
     def all_off(self) -> None:
         self._bus.write_i2c_block_data(self.address, self.ALL_LED_ON_L, [0, 0, 0, 0])
         self._bus.write_i2c_block_data(self.address, self.ALL_LED_OFF_L, [0, 0, 0, 0])
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import json
+import os
 import threading
 from pathlib import Path
 from typing import Callable, Dict, Optional
@@ -23,14 +24,32 @@ _current = {
 
 _shoulder_observers: "set[Callable[[Dict[str, float]], None]]" = set()
 
+# This module is the only writer of the calibration file, so it is read once.
+_loaded = False
+# Text last read from or written to the calibration file; equal payloads skip
+# the temp-file write and fsync.
+_persisted: Optional[str] = None
+
 
 def _ensure_loaded() -> None:
+    """Load calibration data on first use; later calls return immediately."""
+    global _loaded
+    if _loaded:
+        return
+    _load()
+    _loaded = True
+
+
+def _load() -> None:
     """Load calibration data from disk if present."""
+    global _persisted
     if _CALIBRATION_FILE.exists():
         try:
-            data = json.loads(_CALIBRATION_FILE.read_text())
+            text = _CALIBRATION_FILE.read_text()
+            data = json.loads(text)
         except (ValueError, OSError):
             return
+        _persisted = text
         changed = False
         shoulder = data.get("shoulder")
         if isinstance(shoulder, dict):
@@ -62,6 +81,7 @@ def _drop_legacy_fields() -> bool:
 
 def _serialize() -> None:
     """Persist the current calibration to disk."""
+    global _persisted
     try:
         payload = json.dumps(
             {
@@ -73,7 +93,17 @@ def _serialize() -> None:
             indent=2,
             sort_keys=True,
         )
-        _CALIBRATION_FILE.write_text(payload)
+        if payload == _persisted:
+            return
+        # Write a sibling temp file and rename it over the target so a power
+        # loss never leaves a truncated calibration file behind.
+        tmp = _CALIBRATION_FILE.with_name(_CALIBRATION_FILE.name + ".tmp")
+        with open(tmp, "w") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, _CALIBRATION_FILE)
+        _persisted = payload
     except OSError as exc:
         print(f"Failed to write servo calibration: {exc}")
 
@@ -88,6 +118,9 @@ def _clamp_angle(value: float, label: str) -> float:
 
 def get_shoulder_calibration() -> Dict[str, Optional[float]]:
     """Return a copy of the stored shoulder calibration."""
+    if _loaded:
+        # Writers replace the dict wholesale, so no lock is needed to read it.
+        return dict(_current["shoulder"])
     with _LOCK:
         _ensure_loaded()
         return dict(_current["shoulder"])
@@ -107,8 +140,7 @@ def update_shoulder_calibration(
 
     with _LOCK:
         _ensure_loaded()
-        _current["shoulder"]["base_angle"] = base
-        _current["shoulder"]["raise_angle"] = raise_val
+        _current["shoulder"] = {"base_angle": base, "raise_angle": raise_val}
         _serialize()
         snapshot = dict(_current["shoulder"])
 
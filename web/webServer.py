@@ -4,6 +4,7 @@
 # Website     : www.adeept.com
 # Author      : devin
 
+import sys
 import time
 import threading
 import logging
@@ -69,6 +70,14 @@ _WS2812_STATUS = {
     "reason": None,
     "driver": None,
 }
+# Mirrors _WS2812_STATUS "checked and not supported" so the per-update
+# availability check is a single flag read; the dict is kept for status
+# reporting.
+_WS2812_DISABLED = False
+# Bound methods probed once per controller by _bind_ws2812_methods().
+_WS2812_COLOR_WRITERS = ()
+_WS2812_PAUSE = None
+_WS2812_SHOW = None
 
 _distance_lock = threading.Lock()
 _distance_state = {"value": None, "timestamp": 0.0}
@@ -278,17 +287,39 @@ def _set_headlight_state(enabled: bool, *, reason: str) -> bool:
     return True
 
 
+def _set_ws2812_status(supported: bool, reason: Optional[str], driver: Optional[str]) -> None:
+    global _WS2812_DISABLED
+    _WS2812_STATUS.update({"checked": True, "supported": supported, "reason": reason, "driver": driver})
+    _WS2812_DISABLED = not supported
+
+
+def _bind_ws2812_methods(controller) -> None:
+    global _WS2812_COLOR_WRITERS, _WS2812_PAUSE, _WS2812_SHOW
+    if controller is None:
+        _WS2812_COLOR_WRITERS = ()
+        _WS2812_PAUSE = None
+        _WS2812_SHOW = None
+        return
+    writers = (
+        getattr(controller, name, None)
+        for name in ("setColor", "set_all_led_color_data", "set_all_led_color")
+    )
+    _WS2812_COLOR_WRITERS = tuple(func for func in writers if callable(func))
+    pause = getattr(controller, "pause", None)
+    _WS2812_PAUSE = pause if callable(pause) else None
+    show = getattr(controller, "show", None)
+    _WS2812_SHOW = show if callable(show) else None
+
+
 def _initialize_ws2812_driver(force: bool = False) -> bool:
     global WS2812, WS2812_mark
-    state = _WS2812_STATUS
-    if state["checked"] and not state["supported"] and not force:
+    if _WS2812_DISABLED and not force:
         return False
     if WS2812 is not None and WS2812_mark == 1 and not force:
         return True
 
     with _WS2812_INIT_LOCK:
-        state = _WS2812_STATUS
-        if state["checked"] and not state["supported"] and not force:
+        if _WS2812_DISABLED and not force:
             return False
         if WS2812 is not None and WS2812_mark == 1 and not force:
             return True
@@ -308,11 +339,13 @@ def _initialize_ws2812_driver(force: bool = False) -> bool:
                 logger.warning({"evt": "ws2812_unsupported_pi5"})
                 WS2812 = None
                 WS2812_mark = 0
-                state.update({"checked": True, "supported": False, "reason": "unsupported_pi5", "driver": None})
+                _bind_ws2812_methods(None)
+                _set_ws2812_status(False, "unsupported_pi5", None)
                 return False
 
             last_error = None
             for driver in driver_queue:
+                candidate = None
                 try:
                     if driver == "spi":
                         candidate = ws2812_spi.WS2812SPI(
@@ -330,29 +363,39 @@ def _initialize_ws2812_driver(force: bool = False) -> bool:
                             candidate.setColor(70, 70, 255)
                     WS2812 = candidate
                     WS2812_mark = 1
+                    _bind_ws2812_methods(candidate)
                     logger.info({"evt": "ws2812_init", "driver": driver})
-                    state.update({"checked": True, "supported": True, "reason": None, "driver": driver})
+                    _set_ws2812_status(True, None, driver)
                     return True
                 except Exception as exc:
                     last_error = exc
                     logger.warning({"evt": "ws2812_init_failed", "driver": driver, "error": str(exc)})
+                    # Release the SPI device and stop its writer thread before
+                    # falling back; the thread would otherwise keep it alive.
+                    close = getattr(candidate, "close", None) if driver == "spi" else None
+                    if close is not None:
+                        try:
+                            close()
+                        except Exception:
+                            pass
             WS2812 = None
             WS2812_mark = 0
+            _bind_ws2812_methods(None)
             if last_error:
                 logger.warning({"evt": "ws2812_init_error", "error": str(last_error)})
-            state.update({"checked": True, "supported": False, "reason": "init_failed", "driver": None})
+            _set_ws2812_status(False, "init_failed", None)
             return False
         except Exception as exc:
             logger.warning({"evt": "ws2812_init_error", "error": str(exc)})
             WS2812 = None
             WS2812_mark = 0
-            state.update({"checked": True, "supported": False, "reason": "init_error", "driver": None})
+            _bind_ws2812_methods(None)
+            _set_ws2812_status(False, "init_error", None)
             return False
 
 
 def _ws2812_available() -> bool:
-    state = _WS2812_STATUS
-    if state["checked"] and not state["supported"]:
+    if _WS2812_DISABLED:
         return False
     if WS2812 is not None and WS2812_mark == 1:
         return True
@@ -360,23 +403,14 @@ def _ws2812_available() -> bool:
 
 
 def _ws2812_apply_color(r: int, g: int, b: int) -> bool:
-    controller = globals().get("WS2812")
-    if controller is None:
-        return False
-    candidates = [
-        getattr(controller, "setColor", None),
-        getattr(controller, "set_all_led_color_data", None),
-        getattr(controller, "set_all_led_color", None),
-    ]
-    for func in candidates:
-        if callable(func):
-            try:
-                func(r, g, b)
-                return True
-            except Exception as exc:
-                logger.warning(
-                    {"evt": "ws2812_apply_color_failed", "method": getattr(func, "__name__", str(func)), "error": str(exc)}
-                )
+    for func in _WS2812_COLOR_WRITERS:
+        try:
+            func(r, g, b)
+            return True
+        except Exception as exc:
+            logger.warning(
+                {"evt": "ws2812_apply_color_failed", "method": getattr(func, "__name__", str(func)), "error": str(exc)}
+            )
     return False
 
 
@@ -384,23 +418,22 @@ def _ws2812_set_color(r: int, g: int, b: int) -> bool:
     if not _ws2812_available():
         logger.debug({"evt": "ws2812_unavailable", "action": "set_color", "reason": _WS2812_STATUS.get("reason")})
         return False
-    controller = globals().get("WS2812")
-    if controller is None:
+    if WS2812 is None:
         return False
 
-    try:
-        pause = getattr(controller, "pause", None)
-        if callable(pause):
+    pause = _WS2812_PAUSE
+    if pause is not None:
+        try:
             pause()
-    except Exception as exc:
-        logger.debug({"evt": "ws2812_pause_failed", "error": str(exc)})
+        except Exception as exc:
+            logger.debug({"evt": "ws2812_pause_failed", "error": str(exc)})
 
     if not _ws2812_apply_color(r, g, b):
         logger.warning({"evt": "ws2812_set_color_failed", "error": "no applicable color writer"})
         return False
 
-    show = getattr(controller, "show", None)
-    if callable(show):
+    show = _WS2812_SHOW
+    if show is not None:
         try:
             show()
         except TypeError:
@@ -413,11 +446,11 @@ def _ws2812_turn_off() -> bool:
         logger.debug({"evt": "ws2812_unavailable", "action": "turn_off", "reason": _WS2812_STATUS.get("reason")})
         return False
     try:
-        controller = globals().get("WS2812")
+        controller = WS2812
         if controller is None:
             return False
-        pause = getattr(controller, "pause", None)
-        if callable(pause):
+        pause = _WS2812_PAUSE
+        if pause is not None:
             try:
                 pause()
             except Exception as exc:
@@ -429,8 +462,8 @@ def _ws2812_turn_off() -> bool:
             if callable(fallback):
                 fallback(0, 0, 0)
 
-        show = getattr(controller, "show", None)
-        if callable(show):
+        show = _WS2812_SHOW
+        if show is not None:
             try:
                 show()
             except TypeError:
@@ -573,9 +606,9 @@ def _distance_motion_listener() -> None:
     queue = event_bus.listen()
     while True:
         message = queue.get()
-        if message.get("type") != "drive_motion":
+        if message.type != "drive_motion":
             continue
-        payload = message.get("payload") or {}
+        payload = message.payload or {}
         _note_distance_motion(bool(payload.get("active")))
 
 
@@ -1118,6 +1151,19 @@ def configPWM(command_input, response):
         replace_num('init_pwm2 = ', 90)
 
 
+# Exact commands only robotCtrl understands (drive, arm and camera servos).
+# They arrive at joystick rate, so skip the other handler chains for them.
+_ROBOT_CTRL_COMMANDS = frozenset({
+    "forward", "backward", "DS", "left", "right", "TS",
+    "armUp", "armDown", "armStop",
+    "handUp", "handDown", "handStop",
+    "lookleft", "lookright", "LRstop",
+    "grab", "loose", "GLstop",
+    "up", "down", "UDstop",
+    "home",
+})
+
+
 def _process_hardware_command(command_input: str) -> None:
     try:
         logger.info({"evt": "command_queue", "cmd": command_input})
@@ -1129,6 +1175,9 @@ def _process_hardware_command(command_input: str) -> None:
             if _system_mode == "ECO" and not _command_allowed_in_eco(command_input):
                 logger.info({"evt": "mode_blocked", "mode": _system_mode, "cmd": command_input})
                 return
+            if command_input in _ROBOT_CTRL_COMMANDS:
+                robotCtrl(command_input, None)
+                return
         robotCtrl(command_input, None)
         switchCtrl(command_input, None)
         functionSelect(command_input, None)
@@ -1391,6 +1440,8 @@ async def recv_msg(websocket):
             continue
 
         if isinstance(data,str):
+            # Intern so lookups in the command sets hit the identity fast path.
+            data = sys.intern(data)
             handled_locally = False
 
             if data == 'get_info':
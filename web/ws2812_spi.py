@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import math
 import threading
-from typing import Iterable, Sequence, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
 
 try:
     import spidev  # type: ignore
@@ -12,6 +12,20 @@ except ImportError:  # pragma: no cover - runtime dependency on Pi only
 
 ColorTuple = Tuple[int, int, int]
 
+_CHANNEL_INDEX = {"R": 0, "G": 1, "B": 2}
+
+
+def _expand_byte(value: int) -> bytes:
+    """Encode one colour byte as eight 3-bit SPI symbols (24 bits)."""
+    pattern = 0
+    for shift in range(7, -1, -1):
+        pattern = (pattern << 3) | (0b110 if (value >> shift) & 1 else 0b100)
+    return pattern.to_bytes(3, "big")
+
+
+# Every colour byte always expands to the same three SPI bytes.
+_BYTE_LUT: tuple[bytes, ...] = tuple(_expand_byte(value) for value in range(256))
+
 
 class WS2812SPI:
     _ENCODE_ONE = 0b110
@@ -33,10 +47,21 @@ class WS2812SPI:
         self.bus = bus
         self.device = device
         self.order = order.upper()
+        self._order_idx = tuple(_CHANNEL_INDEX.get(ch, 1) for ch in self.order)
         self.speed_hz = speed_hz
         self._spi = spidev.SpiDev()
         self._lock = threading.Lock()
         self._pixels: list[ColorTuple] = [(0, 0, 0)] * self.count
+        # Nine SPI bytes per LED plus a trailing low byte. Frames are encoded
+        # into _tx_buf while the writer thread sends _tx_front; the writer
+        # swaps the two when it takes a frame, so neither is reallocated.
+        self._tx_buf = bytearray(self.count * 9 + 1)
+        self._tx_front = bytearray(self.count * 9 + 1)
+        self._pending: Optional[bytearray] = None  # single slot, newest wins
+        self._cond = threading.Condition(self._lock)
+        self._writer: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+        self._spi_write = None
         self._open = False
 
     # --- lifecycle -----------------------------------------------------
@@ -46,15 +71,33 @@ class WS2812SPI:
         self._spi.open(self.bus, self.device)
         self._spi.max_speed_hz = self.speed_hz
         self._spi.mode = 0
+        # writebytes2 (spidev >= 3.3) takes the bytearray without a list copy.
+        self._spi_write = getattr(self._spi, "writebytes2", None) or self._spi.xfer2
+        # Send the first frame synchronously so a broken bus fails here, before
+        # the writer thread exists, and callers can fall back to another driver.
+        try:
+            with self._lock:
+                self._spi_write(self._encode_pixels(self._pixels))
+        except Exception:
+            self._spi.close()
+            raise
         self._open = True
-        self.show()
+        self._writer = threading.Thread(target=self._writer_loop, name="ws2812-spi", daemon=True)
+        self._writer.start()
 
     def close(self) -> None:
-        if self._open:
-            try:
-                self._spi.close()
-            finally:
-                self._open = False
+        with self._cond:
+            if not self._open:
+                return
+            self._open = False
+            self._cond.notify()
+        writer, self._writer = self._writer, None
+        try:
+            # The writer sends any queued frame before exiting.
+            if writer is not None and writer is not threading.current_thread():
+                writer.join()
+        finally:
+            self._spi.close()
 
     def __del__(self):  # pragma: no cover
         try:
@@ -67,34 +110,54 @@ class WS2812SPI:
         scaled = (value * self.brightness) // 255
         return max(0, min(255, scaled))
 
+    def _encode_pixel(self, rgb: ColorTuple) -> bytes:
+        lut = _BYTE_LUT
+        scale = self._apply_brightness
+        return b"".join([lut[scale(rgb[idx])] for idx in self._order_idx])
+
     def _encode_pixels(self, pixels: Sequence[ColorTuple]) -> bytearray:
-        total_bits = len(pixels) * 24 * 3
-        buffer = bytearray((total_bits + 7) // 8 + 1)
-        bit_index = 0
-        channel_map = {
-            "R": 0,
-            "G": 1,
-            "B": 2,
-        }
-        order = [channel_map.get(ch, 1) for ch in self.order]
+        # Strips are usually painted in one or a few colours, so each distinct
+        # colour is encoded once and its nine SPI bytes reused for every LED.
+        # pixels always holds self.count entries; the final byte stays zero.
+        buffer = self._tx_buf
+        encoded: dict[ColorTuple, bytes] = {}
+        offset = 0
         for rgb in pixels:
-            channels = [self._apply_brightness(rgb[idx]) for idx in order]
-            for value in channels:
-                for shift in range(7, -1, -1):
-                    bit = (value >> shift) & 1
-                    pattern = self._ENCODE_ONE if bit else self._ENCODE_ZERO
-                    for sub in range(2, -1, -1):
-                        if pattern & (1 << sub):
-                            byte_pos = bit_index // 8
-                            buffer[byte_pos] |= 1 << (7 - (bit_index % 8))
-                        bit_index += 1
+            chunk = encoded.get(rgb)
+            if chunk is None:
+                chunk = encoded[rgb] = self._encode_pixel(rgb)
+            buffer[offset:offset + 9] = chunk
+            offset += 9
         return buffer
 
     def _write(self) -> None:
+        # Called with self._lock held: queue the frame for the writer thread
+        # so callers never wait on the SPI transfer.
         if not self._open:
             raise RuntimeError("WS2812SPI driver is not started")
-        payload = self._encode_pixels(self._pixels)
-        self._spi.xfer2(payload)
+        self._pending = self._encode_pixels(self._pixels)
+        self._cond.notify()
+        error = self._error
+        if error is not None:
+            # Report a failed earlier transfer to the next caller.
+            self._error = None
+            raise error
+
+    def _writer_loop(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while self._pending is None and self._open:
+                    cond.wait()
+                frame = self._pending
+                if frame is None:
+                    return
+                self._pending = None
+                self._tx_buf, self._tx_front = self._tx_front, frame
+            try:
+                self._spi_write(frame)
+            except Exception as exc:
+                self._error = exc
 
     def show(self) -> None:
         with self._lock:
@@ -121,7 +184,7 @@ class WS2812SPI:
             self._write()
 
     def pause(self) -> None:
-        # no background thread, but keeping API parity with robotLight
+        # frames are only sent when queued; kept for API parity with robotLight
         pass
 
     def resume(self) -> None: